@@ -0,0 +1,136 @@
+import numpy as np
+import torch
+
+try:
+    from numba import njit, prange
+    numba_found = True
+except ImportError:
+    numba_found = False
+
+
+def _fused_target_numpy(q, absorbing, reward, gamma, out):
+    np.max(q * (1 - absorbing.reshape(-1, 1)), axis=1, out=out)
+    np.multiply(out, gamma, out=out)
+    np.add(reward, out, out=out)
+
+
+def _fused_boosted_target_numpy(q, absorbing, reward, prediction, gamma, out):
+    _fused_target_numpy(q, absorbing, reward, gamma, out)
+    np.subtract(out, prediction, out=out)
+    np.add(prediction, out, out=prediction)
+
+
+if numba_found:
+    @njit(cache=True)
+    def _masked_max_numba(q, i, mask):
+        m = -np.inf
+        for j in range(q.shape[1]):
+            v = q[i, j] * mask
+            if np.isnan(v):
+                return v
+            if v > m:
+                m = v
+
+        return m
+
+    @njit(parallel=True, cache=True)
+    def _fused_target_numba(q, absorbing, reward, gamma, out):
+        for i in prange(q.shape[0]):
+            out[i] = _masked_max_numba(q, i, 1. - absorbing[i])
+            out[i] = reward[i] + gamma * out[i]
+
+    @njit(parallel=True, cache=True)
+    def _fused_boosted_target_numba(q, absorbing, reward, prediction, gamma,
+                                    out):
+        for i in prange(q.shape[0]):
+            out[i] = _masked_max_numba(q, i, 1. - absorbing[i])
+            out[i] = reward[i] + gamma * out[i]
+            out[i] -= prediction[i]
+            prediction[i] += out[i]
+
+
+def fused_target(q, absorbing, reward, gamma, out):
+    """
+    Compute the Bellman optimality target of FQI, i.e. the reward plus the
+    discounted maximum of the next q-values, with the q-values of absorbing
+    states set to zero. The q-values are read only once and are not modified.
+    When Numba is available, the computation is done by a parallel compiled
+    kernel. The discount and the sum are computed in the precision of ``out``
+    and, as in ``np.max``, a NaN q-value makes the target of its sample NaN.
+
+    Args:
+        q (np.ndarray): the q-values of the next states, with shape
+            (n_samples, n_actions);
+        absorbing (np.ndarray): the absorbing flag of each sample;
+        reward (np.ndarray): the reward of each sample;
+        gamma (float): the discount factor;
+        out (np.ndarray): the array where to store the target.
+
+    Returns:
+        The array ``out`` containing the target.
+
+    """
+    gamma = out.dtype.type(gamma)
+    if numba_found:
+        _fused_target_numba(q, absorbing, reward, gamma, out)
+    else:
+        _fused_target_numpy(q, absorbing, reward, gamma, out)
+
+    return out
+
+
+def fused_boosted_target(q, absorbing, reward, prediction, gamma, out):
+    """
+    Compute the target of Boosted FQI, i.e. the residual between the FQI
+    target computed as in ``fused_target`` and the current prediction of the
+    boosted model, and add it to the prediction.
+
+    Args:
+        q (np.ndarray): the q-values of the next states, with shape
+            (n_samples, n_actions);
+        absorbing (np.ndarray): the absorbing flag of each sample;
+        reward (np.ndarray): the reward of each sample;
+        prediction (np.ndarray): the current prediction of each sample. It is
+            updated in place;
+        gamma (float): the discount factor;
+        out (np.ndarray): the array where to store the target.
+
+    Returns:
+        The array ``out`` containing the target.
+
+    """
+    gamma = out.dtype.type(gamma)
+    if numba_found:
+        _fused_boosted_target_numba(q, absorbing, reward, prediction, gamma,
+                                    out)
+    else:
+        _fused_boosted_target_numpy(q, absorbing, reward, prediction, gamma,
+                                    out)
+
+    return out
+
+
+def fused_target_torch(q, not_absorbing, reward, gamma, out):
+    """
+    Compute the same target of ``fused_target`` from q-values stored in a
+    tensor. The computation is done on the device of the tensor, and only the
+    target is copied back to ``out``.
+
+    Args:
+        q (torch.Tensor): the q-values of the next states, with shape
+            (n_samples, n_actions);
+        not_absorbing (torch.Tensor): one minus the absorbing flag of each
+            sample, on the same device of ``q``;
+        reward (torch.Tensor): the reward of each sample, on the same device of
+            ``q``;
+        gamma (float): the discount factor;
+        out (np.ndarray): the array where to store the target.
+
+    Returns:
+        The array ``out`` containing the target.
+
+    """
+    max_q = torch.max(q * not_absorbing.unsqueeze(1), dim=1).values
+    torch.from_numpy(out).copy_(reward + gamma * max_q)
+
+    return out
@@ -1,5 +1,10 @@
+import numpy as np
+import torch
+
 from mushroom_rl.core import Agent
-from mushroom_rl.approximators import Regressor
+from mushroom_rl.approximators import Regressor, Ensemble
+from mushroom_rl.approximators.parametric import TorchApproximator
+from mushroom_rl.utils.dataset import parse_dataset
 
 
 class BatchTD(Agent):
@@ -35,5 +40,64 @@ class BatchTD(Agent):
 
         super().__init__(mdp_info, policy, features)
 
+    def _prepare_dataset(self, dataset, features=None):
+        """
+        Parse the dataset, ensuring that all the returned arrays are
+        C-contiguous, so that they can be passed to the approximator without
+        further copies. Rewards and absorbing flags are converted to the
+        floating point type returned by ``_target_dtype``.
+
+        Args:
+            dataset (list): the dataset to parse;
+            features (object, None): features to apply to the states.
+
+        Returns:
+            The np.ndarray of state, action, reward, next_state, absorbing flag
+            and last step flag.
+
+        """
+        state, action, reward, next_state, absorbing, last = parse_dataset(
+            dataset, features)
+
+        dtype = self._target_dtype()
+        reward = reward.astype(dtype, copy=False)
+        absorbing = absorbing.astype(dtype, copy=False)
+
+        return tuple(np.ascontiguousarray(x) for x in
+                     [state, action, reward, next_state, absorbing, last])
+
+    def _target_dtype(self):
+        """
+        Returns:
+            The floating point type used to compute the targets: single
+            precision for torch approximators not working in double
+            precision, double precision otherwise.
+
+        """
+        model = self._torch_approximator()
+        if model is not None:
+            parameter = next(model.network.parameters(), None)
+            dtype = torch.get_default_dtype() if parameter is None\
+                else parameter.dtype
+
+            if dtype != torch.float64:
+                return np.float32
+
+        return np.float64
+
+    def _torch_approximator(self):
+        """
+        Returns:
+            The ``TorchApproximator`` used by the Q regressor, or the first one
+            of the ensemble when an ensemble is used, None if the regressor
+            is not based on torch.
+
+        """
+        model = self.approximator.model
+        if isinstance(model, Ensemble):
+            model = model[0]
+
+        return model if isinstance(model, TorchApproximator) else None
+
     def _post_load(self):
         self.policy.set_q(self.approximator)
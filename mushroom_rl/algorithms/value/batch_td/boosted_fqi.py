@@ -1,8 +1,7 @@
 import numpy as np
 from tqdm import trange
 
-from mushroom_rl.utils.dataset import parse_dataset
-
+from ._fqi_kernels import fused_boosted_target
 from .fqi import FQI
 
 
@@ -32,21 +31,20 @@ class BoostedFQI(FQI):
         super().__init__(mdp_info, policy, approximator, n_iterations, approximator_params, fit_params, quiet)
 
     def fit(self, dataset, **info):
-        state, action, reward, next_state, absorbing, _ = parse_dataset(dataset)
+        state, action, reward, next_state, absorbing, _ = self._prepare_dataset(dataset)
+        target = np.empty_like(reward)
+
         for _ in trange(self._n_iterations(), dynamic_ncols=True, disable=self._quiet, leave=False):
             if self._target is None:
                 self._target = reward
+                self._target -= self._prediction
+                self._prediction += self._target
             else:
                 self._next_q += self.approximator.predict(next_state,
                                                           idx=self._idx - 1)
-                if np.any(absorbing):
-                    self._next_q *= 1 - absorbing.reshape(-1, 1)
-
-                max_q = np.max(self._next_q, axis=1)
-                self._target = reward + self.mdp_info.gamma * max_q
-
-            self._target -= self._prediction
-            self._prediction += self._target
+                self._target = fused_boosted_target(self._next_q, absorbing,
+                                                    reward, self._prediction,
+                                                    self.mdp_info.gamma, target)
 
             self.approximator.fit(state, action, self._target, idx=self._idx,
                                   **self._fit_params)
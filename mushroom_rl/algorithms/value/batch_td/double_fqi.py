@@ -1,8 +1,6 @@
 import numpy as np
 from tqdm import trange
 
-from mushroom_rl.utils.dataset import parse_dataset
-
 from .fqi import FQI
 
 
@@ -21,35 +19,31 @@ class DoubleFQI(FQI):
                          approximator_params, fit_params, quiet)
 
     def fit(self, dataset, **info):
-        for _ in trange(self._n_iterations(), dynamic_ncols=True, disable=self._quiet, leave=False):
-            state = list()
-            action = list()
-            reward = list()
-            next_state = list()
-            absorbing = list()
-
-            half = len(dataset) // 2
-            for i in range(2):
-                s, a, r, ss, ab, _ = parse_dataset(dataset[i * half:(i + 1) * half])
-                state.append(s)
-                action.append(a)
-                reward.append(r)
-                next_state.append(ss)
-                absorbing.append(ab)
+        half = len(dataset) // 2
+        state, action, reward, next_state, absorbing, _ = self._prepare_dataset(
+            dataset[:2 * half])
+        not_absorbing = 1. - absorbing
+        halves = [slice(None, half), slice(half, None)]
 
+        for _ in trange(self._n_iterations(), dynamic_ncols=True, disable=self._quiet, leave=False):
             if self._target is None:
-                self._target = reward
+                self._target = [reward[h] for h in halves]
             else:
-                for i in range(2):
-                    q_i = self.approximator.predict(next_state[i], idx=i)
-
-                    amax_q = np.expand_dims(np.argmax(q_i, axis=1), axis=1)
-                    max_q = self.approximator.predict(next_state[i], amax_q,
-                                                      idx=1 - i)
-                    if np.any(absorbing[i]):
-                        max_q *= 1 - absorbing[i]
-                    self._target[i] = reward[i] + self.mdp_info.gamma * max_q
-
-            for i in range(2):
-                self.approximator.fit(state[i], action[i], self._target[i], idx=i,
+                self._target = [
+                    self._double_target(next_state[h], reward[h],
+                                        not_absorbing[h], i)
+                    for i, h in enumerate(halves)
+                ]
+
+            for i, h in enumerate(halves):
+                self.approximator.fit(state[h], action[h], self._target[i], idx=i,
                                       **self._fit_params)
+
+    def _double_target(self, next_state, reward, not_absorbing, idx):
+        q = self.approximator.predict(next_state, idx=idx)
+        amax_q = np.argmax(q, axis=1).reshape(-1, 1)
+
+        max_q = self.approximator.predict(next_state, amax_q, idx=1 - idx)
+        max_q *= not_absorbing
+
+        return reward + self.mdp_info.gamma * max_q
@@ -1,10 +1,13 @@
 import numpy as np
+import torch
 from tqdm import trange
 
 from mushroom_rl.algorithms.value.batch_td import BatchTD
-from mushroom_rl.utils.dataset import parse_dataset
+from mushroom_rl.approximators.parametric import TorchApproximator
 from mushroom_rl.utils.parameters import to_parameter
 
+from ._fqi_kernels import fused_target, fused_target_torch
+
 
 class FQI(BatchTD):
     """
@@ -35,16 +38,31 @@ class FQI(BatchTD):
         super().__init__(mdp_info, policy, approximator, approximator_params, fit_params)
 
     def fit(self, dataset, **info):
-        state, action, reward, next_state, absorbing, _ = parse_dataset(dataset)
+        state, action, reward, next_state, absorbing, _ = self._prepare_dataset(dataset)
+        target = np.empty_like(reward)
+
+        use_cuda = self._use_cuda()
+        if use_cuda:
+            reward_cuda = torch.from_numpy(reward).cuda()
+            not_absorbing_cuda = torch.from_numpy(1. - absorbing).cuda()
+
         for _ in trange(self._n_iterations(), dynamic_ncols=True, disable=self._quiet, leave=False):
             if self._target is None:
                 self._target = reward
+            elif use_cuda:
+                with torch.no_grad():
+                    q = self.approximator.predict(next_state, output_tensor=True)
+                self._target = fused_target_torch(q, not_absorbing_cuda,
+                                                  reward_cuda,
+                                                  self.mdp_info.gamma, target)
             else:
                 q = self.approximator.predict(next_state)
-                if np.any(absorbing):
-                    q *= 1 - absorbing.reshape(-1, 1)
-
-                max_q = np.max(q, axis=1)
-                self._target = reward + self.mdp_info.gamma * max_q
+                self._target = fused_target(q, absorbing, reward,
+                                            self.mdp_info.gamma, target)
 
             self.approximator.fit(state, action, self._target, **self._fit_params)
+
+    def _use_cuda(self):
+        model = self.approximator.model
+
+        return isinstance(model, TorchApproximator) and model.use_cuda
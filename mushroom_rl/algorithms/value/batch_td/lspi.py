@@ -3,7 +3,6 @@ import numpy as np
 from mushroom_rl.algorithms.value.batch_td import BatchTD
 from mushroom_rl.approximators.parametric import LinearApproximator
 from mushroom_rl.features import get_action_features
-from mushroom_rl.utils.dataset import parse_dataset
 from mushroom_rl.utils.parameters import to_parameter
 
 
@@ -30,16 +29,18 @@ class LSPI(BatchTD):
                          approximator_params, fit_params, features)
 
     def fit(self, dataset, **info):
-        phi_state, action, reward, phi_next_state, absorbing, _ = parse_dataset(
+        phi_state, action, reward, phi_next_state, absorbing, _ = self._prepare_dataset(
             dataset, self.phi)
         phi_state_action = get_action_features(phi_state, action,
                                                self.mdp_info.action_space.n)
+        C = phi_state_action.T.dot(phi_state_action)
+        b = (phi_state_action.T.dot(reward)).reshape(-1, 1)
+        not_absorbing = (1. - absorbing).reshape(-1, 1)
 
         norm = np.inf
         while norm > self._epsilon():
             q = self.approximator.predict(phi_next_state)
-            if np.any(absorbing):
-                q *= 1 - absorbing.reshape(-1, 1)
+            q *= not_absorbing
 
             next_action = np.argmax(q, axis=1).reshape(-1, 1)
             phi_next_state_next_action = get_action_features(
@@ -48,10 +49,8 @@ class LSPI(BatchTD):
                 self.mdp_info.action_space.n
             )
 
-            tmp = phi_state_action - self.mdp_info.gamma *\
-                phi_next_state_next_action
-            A = phi_state_action.T.dot(tmp)
-            b = (phi_state_action.T.dot(reward)).reshape(-1, 1)
+            A = C - self.mdp_info.gamma * phi_state_action.T.dot(
+                phi_next_state_next_action)
 
             old_w = self.approximator.get_weights()
             if np.linalg.matrix_rank(A) == A.shape[1]:
@@ -8,9 +8,9 @@ from copy import deepcopy
 from pathlib import Path
 
 if sys.version_info >= (3, 7):
-    from zipfile import ZipFile
+    from zipfile import ZipFile, ZIP_STORED
 else:
-    from zipfile37 import ZipFile
+    from zipfile37 import ZipFile, ZIP_STORED
 
 
 class Serializable(object):
@@ -20,7 +20,8 @@ class Serializable(object):
     It is possible to save the state of the agent with different levels of
 
     """
-    def save(self, path, full_save=False):
+    def save(self, path, full_save=False, compression=ZIP_STORED,
+             pickle_protocol=pickle.DEFAULT_PROTOCOL):
         """
         Serialize and save the object to the given path on disk.
 
@@ -28,16 +29,27 @@ class Serializable(object):
             path (Path, str): Relative or absolute path to the object save
                 location;
             full_save (bool): Flag to specify the amount of data to save for
-                MushroomRL data structures.
+                MushroomRL data structures;
+            compression (int, ZIP_STORED): compression method of the zip file,
+                e.g. ``ZIP_STORED`` or ``ZIP_DEFLATED``;
+            pickle_protocol (int, pickle.DEFAULT_PROTOCOL): protocol used to
+                save the attributes with the pickle method. With protocol 5,
+                available on Python 3.8 or later, their large buffers (e.g.
+                numpy arrays) are stored in separate ``<name>.buf<i>`` entries
+                of the zip file. Archives saved in this format cannot be loaded
+                with Python 3.6 or 3.7, nor with previous versions of
+                MushroomRL.
 
         """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with ZipFile(path, 'w') as zip_file:
-            self.save_zip(zip_file, full_save)
+        with open(path, 'wb', buffering=8 * 1024 * 1024) as f, \
+                ZipFile(f, 'w', compression=compression) as zip_file:
+            self.save_zip(zip_file, full_save, pickle_protocol=pickle_protocol)
 
-    def save_zip(self, zip_file, full_save, folder=''):
+    def save_zip(self, zip_file, full_save, folder='',
+                 pickle_protocol=pickle.DEFAULT_PROTOCOL):
         """
         Serialize and save the agent to the given path on disk.
 
@@ -45,15 +57,18 @@ class Serializable(object):
             zip_file (ZipFile): ZipFile where te object needs to be saved;
             full_save (bool): flag to specify the amount of data to save for
                 MushroomRL data structures;
-            folder (string, ''): subfolder to be used by the save method.
+            folder (string, ''): subfolder to be used by the save method;
+            pickle_protocol (int, pickle.DEFAULT_PROTOCOL): protocol used to
+                save the attributes with the pickle method.
         """
         primitive_dictionary = dict()
 
         for att, method in self._save_attributes.items():
+            full_save_only = method.endswith('!')
 
-            if not method.endswith('!') or full_save:
-                method = method[:-1] if method.endswith('!') else method
-                attribute = getattr(self, att) if hasattr(self, att) else None
+            if not full_save_only or full_save:
+                method = method[:-1] if full_save_only else method
+                attribute = getattr(self, att, None)
 
                 if attribute is not None:
                     if method == 'primitive':
@@ -64,7 +79,8 @@ class Serializable(object):
                         save_method = getattr(self, '_save_{}'.format(method))
                         file_name = "{}.{}".format(att, method)
                         save_method(zip_file, file_name, attribute,
-                                    full_save=full_save, folder=folder)
+                                    full_save=full_save, folder=folder,
+                                    pickle_protocol=pickle_protocol)
                     else:
                         raise NotImplementedError(
                             "Method _save_{} is not implemented for class '{}'".
@@ -77,7 +93,8 @@ class Serializable(object):
             primitive_dictionary=primitive_dictionary
         )
 
-        self._save_pickle(zip_file, 'config', config_data, folder=folder)
+        self._save_pickle(zip_file, 'config', config_data, folder=folder,
+                          pickle_protocol=pickle_protocol)
 
     @classmethod
     def load(cls, path):
@@ -199,10 +216,30 @@ class Serializable(object):
         else:
            return name
 
+    @staticmethod
+    def _pickle_buffer_name(name, i):
+        return '{}.buf{}'.format(name, i)
+
     @staticmethod
     def _load_pickle(zip_file, name):
+        buffers = list()
+        while True:
+            try:
+                info = zip_file.getinfo(
+                    Serializable._pickle_buffer_name(name, len(buffers)))
+            except KeyError:
+                break
+
+            buffer = bytearray(info.file_size)
+            with zip_file.open(info, 'r') as f:
+                f.readinto(buffer)
+            buffers.append(buffer)
+
         with zip_file.open(name, 'r') as f:
-            return pickle.load(f)
+            if buffers:
+                return pickle.load(f, buffers=buffers)
+            else:
+                return pickle.load(f)
 
     @staticmethod
     def _load_numpy(zip_file, name):
@@ -224,10 +261,21 @@ class Serializable(object):
         return Serializable.load_zip(zip_file, name)
 
     @staticmethod
-    def _save_pickle(zip_file, name, obj, folder, **_):
+    def _save_pickle(zip_file, name, obj, folder,
+                     pickle_protocol=pickle.DEFAULT_PROTOCOL, **_):
         path = Serializable._append_folder(folder, name)
-        with zip_file.open(path, 'w') as f:
-            pickle.dump(obj, f, protocol=pickle.DEFAULT_PROTOCOL)
+        if pickle_protocol >= 5:
+            buffers = list()
+            with zip_file.open(path, 'w') as f:
+                pickle.dump(obj, f, protocol=pickle_protocol,
+                            buffer_callback=buffers.append)
+
+            for i, buffer in enumerate(buffers):
+                buffer_name = Serializable._pickle_buffer_name(path, i)
+                zip_file.writestr(buffer_name, buffer.raw())
+        else:
+            with zip_file.open(path, 'w') as f:
+                pickle.dump(obj, f, protocol=pickle_protocol)
 
     @staticmethod
     def _save_numpy(zip_file, name, obj, folder, **_):
@@ -249,7 +297,8 @@ class Serializable(object):
             f.write(string.encode('utf8'))
 
     @staticmethod
-    def _save_mushroom(zip_file, name, obj, folder, full_save):
+    def _save_mushroom(zip_file, name, obj, folder, full_save,
+                       pickle_protocol=pickle.DEFAULT_PROTOCOL):
         new_folder = Serializable._append_folder(folder, name)
         if isinstance(obj, list):
             config_data = dict(
@@ -258,12 +307,15 @@ class Serializable(object):
                 primitive_dictionary=dict(len=len(obj))
             )
 
-            Serializable._save_pickle(zip_file, 'config', config_data, folder=new_folder)
+            Serializable._save_pickle(zip_file, 'config', config_data, folder=new_folder,
+                                      pickle_protocol=pickle_protocol)
             for i, element in enumerate(obj):
                 element_folder = Serializable._append_folder(new_folder, str(i))
-                element.save_zip(zip_file, full_save=full_save, folder=element_folder)
+                element.save_zip(zip_file, full_save=full_save, folder=element_folder,
+                                 pickle_protocol=pickle_protocol)
         else:
-            obj.save_zip(zip_file, full_save=full_save, folder=new_folder)
+            obj.save_zip(zip_file, full_save=full_save, folder=new_folder,
+                         pickle_protocol=pickle_protocol)
 
     @staticmethod
     def _get_serialization_method(class_name):
@@ -73,18 +73,12 @@ def get_action_features(phi_state, action, n_actions):
     if len(phi_state.shape) > 1:
         assert phi_state.shape[0] == action.shape[0]
 
-        phi = np.ones((phi_state.shape[0], n_actions * phi_state[0].size))
-        i = 0
-        for s, a in zip(phi_state, action):
-            start = s.size * int(a[0])
-            stop = start + s.size
+        n_samples = phi_state.shape[0]
+        size = phi_state[0].size
 
-            phi_sa = np.zeros(n_actions * s.size)
-            phi_sa[start:stop] = s
-
-            phi[i] = phi_sa
-
-            i += 1
+        phi = np.zeros((n_samples, n_actions, size))
+        phi[np.arange(n_samples), action[:, 0].astype(int)] = phi_state
+        phi = phi.reshape(n_samples, n_actions * size)
     else:
         start = phi_state.size * action[0]
         stop = start + phi_state.size
@@ -45,8 +45,7 @@ def parse_dataset(dataset, features=None):
             absorbing[i] = dataset[i][4]
             last[i] = dataset[i][5]
 
-    return np.array(state), np.array(action), np.array(reward), np.array(
-        next_state), np.array(absorbing), np.array(last)
+    return state, action, reward, next_state, absorbing, last
 
 
 def arrays_as_dataset(states, actions, rewards, next_states, absorbings, lasts):
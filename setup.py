@@ -35,6 +35,7 @@ extras = {
     'box2d': ['box2d-py~=2.3.5'],
     'bullet': ['pybullet'],
     'mujoco': ['mujoco>=2.3', 'dm_control>=1.0.9'],
+    'numba': ['numba'],
     'plots': ['pyqtgraph']
 }
 
@@ -1,4 +1,7 @@
 import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
 from sklearn.ensemble import ExtraTreesRegressor
 
 from datetime import datetime
@@ -6,6 +9,8 @@ from helper.utils import TestUtils as tu
 
 from mushroom_rl.core import Agent
 from mushroom_rl.algorithms.value import BoostedFQI, DoubleFQI, FQI
+from mushroom_rl.approximators import Ensemble
+from mushroom_rl.approximators.parametric import LinearApproximator, TorchApproximator
 from mushroom_rl.core import Core
 from mushroom_rl.environments import *
 from mushroom_rl.policy import EpsGreedy
@@ -117,3 +122,70 @@ def test_double_fqi_save(tmpdir):
         load_attr = getattr(agent_load, att)
 
         tu.assert_eq(save_attr, load_attr)
+
+
+class Network(nn.Module):
+    def __init__(self, input_shape, output_shape, **kwargs):
+        super().__init__()
+
+        self._h = nn.Linear(input_shape[0], output_shape[0])
+
+    def forward(self, state, action=None):
+        q = self._h(state.float())
+
+        if action is None:
+            return q
+        else:
+            return torch.squeeze(q.gather(1, action.long()), dim=1)
+
+
+def learn_target(approximator, approximator_params, fit_params=None):
+    mdp = CarOnHill()
+    np.random.seed(1)
+    torch.manual_seed(1)
+
+    pi = EpsGreedy(epsilon=Parameter(value=1.))
+
+    approximator_params.update(input_shape=mdp.info.observation_space.shape,
+                               n_actions=mdp.info.action_space.n)
+
+    agent = FQI(mdp.info, pi, approximator, n_iterations=2,
+                approximator_params=approximator_params,
+                fit_params=fit_params, quiet=True)
+
+    target_dtype = agent._target_dtype()
+
+    core = Core(agent, mdp)
+    core.learn(n_episodes=2, n_episodes_per_fit=2)
+
+    return agent, target_dtype
+
+
+def test_fqi_target_dtype():
+    torch_params = dict(network=Network,
+                        output_shape=(CarOnHill().info.action_space.n,),
+                        optimizer={'class': torch.optim.Adam,
+                                   'params': {'lr': 1e-3}},
+                        loss=F.mse_loss)
+
+    agent, target_dtype = learn_target(TorchApproximator, dict(torch_params),
+                                       fit_params=dict(n_epochs=1))
+    assert target_dtype == np.float32
+    assert agent._target.dtype == target_dtype
+
+    agent, target_dtype = learn_target(TorchApproximator,
+                                       dict(torch_params, n_models=2),
+                                       fit_params=dict(n_epochs=1))
+    assert isinstance(agent.approximator.model, Ensemble)
+    assert target_dtype == np.float32
+    assert agent._target.dtype == target_dtype
+
+    agent, target_dtype = learn_target(ExtraTreesRegressor,
+                                       dict(n_estimators=5))
+    assert target_dtype == np.float64
+    assert agent._target.dtype == target_dtype
+
+    agent, target_dtype = learn_target(LinearApproximator,
+                                       dict(output_shape=(1,)))
+    assert target_dtype == np.float64
+    assert agent._target.dtype == target_dtype
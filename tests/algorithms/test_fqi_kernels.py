@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from sklearn.ensemble import ExtraTreesRegressor
+
+from mushroom_rl.algorithms.value import FQI
+from mushroom_rl.algorithms.value.batch_td import _fqi_kernels
+from mushroom_rl.approximators import Ensemble
+from mushroom_rl.approximators.parametric import TorchApproximator
+from mushroom_rl.core import MDPInfo
+from mushroom_rl.policy import EpsGreedy
+from mushroom_rl.utils.parameters import Parameter
+from mushroom_rl.utils.spaces import Box, Discrete
+
+backends = ['numpy', pytest.param('numba', marks=pytest.mark.skipif(
+    not _fqi_kernels.numba_found, reason='numba is not installed'))]
+
+
+def generate_data(dtype):
+    np.random.seed(1)
+
+    n_samples = 100
+    q = np.random.randn(n_samples, 3).astype(dtype)
+    absorbing = (np.random.rand(n_samples) < .2).astype(dtype)
+    reward = np.random.randn(n_samples).astype(dtype)
+    prediction = np.random.randn(n_samples).astype(dtype)
+
+    q[0, 1] = np.nan
+    absorbing[0] = 0.
+    q[1, 2] = np.nan
+    absorbing[1] = 1.
+    q[2, 0] = np.inf
+    absorbing[2] = 1.
+    q[3, :] = -np.inf
+    absorbing[3] = 0.
+
+    return q, absorbing, reward, prediction
+
+
+def reference_target(q, absorbing, reward, gamma):
+    gamma = reward.dtype.type(gamma)
+
+    return reward + gamma * np.max(q * (1 - absorbing).reshape(-1, 1), axis=1)
+
+
+def set_backend(monkeypatch, backend):
+    monkeypatch.setattr(_fqi_kernels, 'numba_found', backend == 'numba')
+
+
+@pytest.mark.parametrize('backend', backends)
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_fused_target(monkeypatch, backend, dtype):
+    set_backend(monkeypatch, backend)
+    q, absorbing, reward, _ = generate_data(dtype)
+    q_copy = q.copy()
+
+    target = _fqi_kernels.fused_target(q, absorbing, reward, .99,
+                                       np.empty_like(reward))
+    target_test = reference_target(q, absorbing, reward, .99)
+
+    assert target.dtype == dtype
+    assert np.isnan(target[0]) and np.isnan(target[1]) and np.isnan(target[2])
+    np.testing.assert_array_equal(target, target_test)
+    np.testing.assert_array_equal(q, q_copy)
+
+
+@pytest.mark.parametrize('backend', backends)
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_fused_boosted_target(monkeypatch, backend, dtype):
+    set_backend(monkeypatch, backend)
+    q, absorbing, reward, prediction = generate_data(dtype)
+    prediction_test = prediction.copy()
+
+    target = _fqi_kernels.fused_boosted_target(q, absorbing, reward,
+                                               prediction, .99,
+                                               np.empty_like(reward))
+    target_test = reference_target(q, absorbing, reward, .99)
+    target_test -= prediction_test
+    prediction_test += target_test
+
+    assert target.dtype == dtype
+    np.testing.assert_array_equal(target, target_test)
+    np.testing.assert_array_equal(prediction, prediction_test)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_fused_target_torch(dtype):
+    q, absorbing, reward, _ = generate_data(dtype)
+    q_copy = q.copy()
+
+    target = _fqi_kernels.fused_target_torch(torch.from_numpy(q),
+                                             torch.from_numpy(1 - absorbing),
+                                             torch.from_numpy(reward), .99,
+                                             np.empty_like(reward))
+    target_test = reference_target(q, absorbing, reward, .99)
+
+    assert target.dtype == dtype
+    assert np.isnan(target[0]) and np.isnan(target[1]) and np.isnan(target[2])
+    np.testing.assert_array_equal(target, target_test)
+    np.testing.assert_array_equal(q, q_copy)
+
+
+class Network(nn.Module):
+    def __init__(self, input_shape, output_shape, **kwargs):
+        super().__init__()
+
+        self._h = nn.Linear(input_shape[0], output_shape[0])
+
+    def forward(self, state, action=None):
+        q = self._h(state.float())
+
+        if action is None:
+            return q
+        else:
+            return torch.squeeze(q.gather(1, action.long()), dim=1)
+
+
+def build_fqi(approximator, **approximator_params):
+    mdp_info = MDPInfo(Box(-1., 1., shape=(2,)), Discrete(3), .99, 100)
+    pi = EpsGreedy(epsilon=Parameter(value=1.))
+
+    approximator_params.update(input_shape=mdp_info.observation_space.shape,
+                               n_actions=mdp_info.action_space.n)
+    if approximator is TorchApproximator:
+        approximator_params.update(network=Network,
+                                   output_shape=(mdp_info.action_space.n,),
+                                   optimizer={'class': torch.optim.Adam,
+                                              'params': {'lr': 1e-3}},
+                                   loss=F.mse_loss)
+
+    return FQI(mdp_info, pi, approximator, n_iterations=1,
+               approximator_params=approximator_params, quiet=True)
+
+
+def test_fqi_use_cuda():
+    agent = build_fqi(TorchApproximator)
+    assert not agent._use_cuda()
+
+    # Only the flag is checked, so no CUDA device is needed
+    agent.approximator.model._use_cuda = True
+    assert agent._use_cuda()
+
+    agent = build_fqi(TorchApproximator, n_models=2)
+    assert isinstance(agent.approximator.model, Ensemble)
+    for model in agent.approximator.model:
+        model._use_cuda = True
+    assert not agent._use_cuda()
+
+    agent = build_fqi(ExtraTreesRegressor, n_estimators=5)
+    assert not agent._use_cuda()
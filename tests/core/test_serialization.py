@@ -0,0 +1,130 @@
+import pickle
+import pytest
+import numpy as np
+import torch
+
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from mushroom_rl.core import Serializable
+
+
+class NumpyObject(Serializable):
+    def __init__(self, **arrays):
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+        self._add_save_attr(**{name: 'numpy' for name in arrays})
+
+
+def test_numpy_save_load(tmpdir):
+    agent_path = tmpdir / 'numpy_object'
+
+    arrays = dict(
+        c_order=np.arange(12.).reshape(3, 4),
+        fortran_order=np.asfortranarray(np.arange(12).reshape(3, 4)),
+        zero_dim=np.array(3.5),
+        empty=np.zeros((0, 2), dtype=np.float32)
+    )
+
+    obj_save = NumpyObject(**arrays)
+    obj_save.save(agent_path)
+    obj_load = Serializable.load(agent_path)
+
+    for name, array in arrays.items():
+        loaded_array = getattr(obj_load, name)
+
+        assert loaded_array.dtype == array.dtype
+        assert loaded_array.shape == array.shape
+        assert np.array_equal(loaded_array, array)
+        assert loaded_array.flags.f_contiguous == array.flags.f_contiguous
+        assert loaded_array.flags.writeable
+
+
+class PickleObject(Serializable):
+    def __init__(self, data):
+        self.data = data
+
+        self._add_save_attr(data='pickle')
+
+
+def test_pickle_default_protocol_save_load(tmpdir):
+    agent_path = tmpdir / 'pickle_object'
+
+    data = dict(array=np.random.rand(1000, 10), string='string')
+
+    obj_save = PickleObject(data)
+    obj_save.save(agent_path)
+
+    with ZipFile(agent_path, 'r') as zip_file:
+        assert not any('.buf' in name for name in zip_file.namelist())
+        with zip_file.open('data.pickle', 'r') as f:
+            assert f.read(2)[1] == pickle.DEFAULT_PROTOCOL
+
+    obj_load = Serializable.load(agent_path)
+
+    assert obj_load.data['string'] == data['string']
+    assert np.array_equal(obj_load.data['array'], data['array'])
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5,
+                    reason='pickle protocol 5 not available')
+def test_pickle_out_of_band_save_load(tmpdir):
+    agent_path = tmpdir / 'pickle_object'
+
+    data = dict(
+        array=np.random.rand(1000, 10),
+        arrays=[np.arange(100, dtype=np.int32), np.ones((5, 5)).T],
+        string='string'
+    )
+
+    obj_save = PickleObject(data)
+    obj_save.save(agent_path, pickle_protocol=5)
+
+    with ZipFile(agent_path, 'r') as zip_file:
+        assert 'data.pickle.buf0' in zip_file.namelist()
+
+    obj_load = Serializable.load(agent_path)
+
+    assert obj_load.data['string'] == data['string']
+    assert np.array_equal(obj_load.data['array'], data['array'])
+    for loaded_array, array in zip(obj_load.data['arrays'], data['arrays']):
+        assert loaded_array.dtype == array.dtype
+        assert np.array_equal(loaded_array, array)
+
+    loaded_array = obj_load.data['array']
+    assert loaded_array.flags.writeable
+    loaded_array += 1.
+    assert np.array_equal(loaded_array, data['array'] + 1.)
+
+
+class CompressedObject(Serializable):
+    def __init__(self, array, tensor, data):
+        self.array = array
+        self.tensor = tensor
+        self.data = data
+
+        self._add_save_attr(array='numpy', tensor='torch', data='pickle')
+
+
+def test_compressed_save_load(tmpdir):
+    agent_path = tmpdir / 'compressed_object'
+
+    array = np.zeros((100, 10))
+    tensor = torch.arange(100.)
+    data = dict(array=np.ones(1000), string='string')
+
+    obj_save = CompressedObject(array, tensor, data)
+    obj_save.save(agent_path, compression=ZIP_DEFLATED)
+
+    with ZipFile(agent_path, 'r') as zip_file:
+        for info in zip_file.infolist():
+            assert info.compress_type == ZIP_DEFLATED
+        array_info = zip_file.getinfo('array.numpy')
+        assert array_info.compress_size < array_info.file_size
+
+    obj_load = Serializable.load(agent_path)
+
+    assert np.array_equal(obj_load.array, array)
+    assert torch.equal(obj_load.tensor, tensor)
+    assert obj_load.data['string'] == data['string']
+    assert np.array_equal(obj_load.data['array'], data['array'])
@@ -1,6 +1,6 @@
 import numpy as np
 
-from mushroom_rl.features import Features
+from mushroom_rl.features import Features, get_action_features
 from mushroom_rl.features.tiles import Tiles, VoronoiTiles
 from mushroom_rl.features.basis import GaussianRBF, FourierBasis, PolynomialBasis
 from mushroom_rl.features.tensors import GaussianRBFTensor, RandomFourierBasis
@@ -189,3 +189,22 @@ def test_random_fourier():
 
     assert np.allclose(features(x), res)
     assert features.size == res.size
+
+
+def test_action_features():
+    np.random.seed(1)
+
+    n_actions = 3
+    phi_state = np.random.rand(20, 4)
+    actions_int = np.random.randint(n_actions, size=(20, 1))
+
+    for action in [actions_int, actions_int.astype(float)]:
+        phi = get_action_features(phi_state, action, n_actions)
+
+        phi_test = np.zeros((20, n_actions * 4))
+        for i, (s, a) in enumerate(zip(phi_state, action)):
+            start = s.size * int(a[0])
+            phi_test[i, start:start + s.size] = s
+
+        assert phi.shape == phi_test.shape
+        assert np.array_equal(phi, phi_test)